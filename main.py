@@ -1,4 +1,5 @@
 import sys
+import ctypes
 import traceback
 from PySide6 import QtWidgets
 from PySide6.QtCore import QLockFile, QDir, QStandardPaths
@@ -17,7 +18,39 @@ def _excepthook(exc_type, exc, tb):
     sys.__excepthook__(exc_type, exc, tb)
 
 
-def _acquire_single_instance_lock(app_name: str = "AnimatedWindowsBorders") -> QLockFile | None:
+class _NativeMutexLock:
+    """I hold a Windows named mutex for the process lifetime (single instance)."""
+
+    ERROR_ALREADY_EXISTS = 183
+
+    def __init__(self, handle):
+        self._handle = handle
+
+    def unlock(self):
+        if self._handle:
+            ctypes.windll.kernel32.CloseHandle(self._handle)
+            self._handle = None
+
+
+def _acquire_single_instance_lock(app_name: str = "AnimatedWindowsBorders"):
+    if sys.platform == "win32":
+        # Um syscall, sem I/O de arquivo e sem lock obsoleto para limpar.
+        # use_last_error: o ctypes pode sujar o last-error da thread entre
+        # chamadas; GetLastError() direto não é confiável aqui.
+        k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        k32.CreateMutexW.argtypes = [ctypes.c_void_p, ctypes.c_bool, ctypes.c_wchar_p]
+        k32.CreateMutexW.restype = ctypes.c_void_p
+        k32.CloseHandle.argtypes = [ctypes.c_void_p]
+        handle = k32.CreateMutexW(None, False, f"Global\\{app_name}")
+        err = ctypes.get_last_error()
+        if not handle:
+            return None
+        if err == _NativeMutexLock.ERROR_ALREADY_EXISTS:
+            k32.CloseHandle(handle)
+            return None
+        return _NativeMutexLock(handle)
+
+    # Fallback fora do Windows: QLockFile em diretório gravável
     base_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
     if not base_dir:
         base_dir = QStandardPaths.writableLocation(QStandardPaths.TempLocation)
@@ -28,7 +61,7 @@ def _acquire_single_instance_lock(app_name: str = "AnimatedWindowsBorders") -> Q
     lock = QLockFile(lock_path)
     lock.setStaleLockTime(10_000)  # 10s: limpa locks obsoletos
 
-    if not lock.tryLock(1):
+    if not lock.tryLock(0):
         lock.removeStaleLockFile()
         if not lock.tryLock(0):
             return None
@@ -57,7 +90,8 @@ def main() -> int:
         if not bool(ctrl.config_data.get("service_enabled", False)):
             win.show()
 
-        # Libera o lock ao sair
+        # Solta os hooks/timers e libera o lock ao sair
+        app.aboutToQuit.connect(ctrl.shutdown)
         app.aboutToQuit.connect(lambda: lock.unlock())
 
         # Chamada correta no PySide6 moderno
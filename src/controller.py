@@ -1,36 +1,203 @@
 from typing import List, Tuple
-import copy
+import sys
+import json
+import time
+import ctypes
+import ctypes.wintypes as wt
 from PySide6 import QtCore
 
 from src.model import (
-    Config,
+    MatchType,
+    current_config,
     normalize_hex,
     list_process_names,
     list_visible_windows,
     apply_colors_once,
     ensure_single_global_on_top,
+    prime_rule,
+    invalidate_rule_cache,
 )
 
+def _clone_rule(r: dict) -> dict:
+    """I shallow-clone a rule dict (fast path; rules hold only flat JSON data)."""
+    out = {**r, "animation": dict(r.get("animation") or {})}
+    # O clone ainda vai ser editado; não pode herdar a marca de normalizada
+    out.pop("_clean", None)
+    return out
+
+
+class _ProcListWorker(QtCore.QRunnable):
+    """I enumerate process names off the GUI thread and post the result back."""
+
+    def __init__(self, ctrl: "AppController"):
+        super().__init__()
+        self._ctrl = ctrl
+
+    def run(self):
+        try:
+            names = list_process_names()
+        except Exception:
+            names = []
+        QtCore.QMetaObject.invokeMethod(
+            self._ctrl, "_on_procs_listed", QtCore.Qt.QueuedConnection,
+            QtCore.Q_ARG(list, names)
+        )
+
+
+class _SaveWorker(QtCore.QRunnable):
+    """I normalize and persist a config snapshot off the GUI thread."""
+
+    def __init__(self, ctrl: "AppController", snapshot: dict):
+        super().__init__()
+        self._ctrl = ctrl
+        self._snapshot = snapshot
+
+    def run(self):
+        data = self._snapshot
+        try:
+            ensure_single_global_on_top(data)
+            self._ctrl.cfg.set(data)
+            self._ctrl.cfg.save()
+        except Exception as e:
+            # No Windows, os.replace falha com PermissionError quando AV ou
+            # indexador segura o config.json; reporta em vez de sumir no pool
+            QtCore.QMetaObject.invokeMethod(
+                self._ctrl, "_on_save_failed", QtCore.Qt.QueuedConnection,
+                QtCore.Q_ARG(str, str(e))
+            )
+            return
+        QtCore.QMetaObject.invokeMethod(
+            self._ctrl, "_on_save_done", QtCore.Qt.QueuedConnection
+        )
+
+
+# ---------- WinEvent constants ----------
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+
+_WinEventProc = ctypes.WINFUNCTYPE(
+    None, wt.HANDLE, wt.DWORD, wt.HWND, wt.LONG, wt.LONG, wt.DWORD, wt.DWORD
+)
+
+
+class WinEventBridge(QtCore.QObject):
+    """I translate Win32 WinEvents (focus/move-size changes) into a Qt signal
+    so border colors are re-applied only when something actually changed."""
+
+    event_fired = QtCore.Signal()
+
+    _EVENTS = (
+        EVENT_SYSTEM_FOREGROUND,
+        EVENT_SYSTEM_MOVESIZEEND,
+        EVENT_OBJECT_LOCATIONCHANGE,
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hooks: list = []
+        # Coalesce de rajadas de eventos dentro do mesmo giro do loop
+        self._emit_pending = False
+        # Mantém o callback vivo enquanto os hooks existirem
+        self._proc = _WinEventProc(self._on_event)
+
+    def _on_event(self, hook, event, hwnd, id_object, id_child, thread, time_ms):
+        # LOCATIONCHANGE também chega para OBJID_CURSOR (todo movimento do
+        # mouse) e carets; só a janela em si nos interessa.
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+            return
+        # OUTOFCONTEXT: entregue via message loop da thread GUI; N eventos no
+        # mesmo giro viram um único sweep.
+        if not self._emit_pending:
+            self._emit_pending = True
+            QtCore.QTimer.singleShot(0, self._flush_emit)
+
+    def _flush_emit(self):
+        self._emit_pending = False
+        self.event_fired.emit()
+
+    def start(self):
+        if self._hooks:
+            return
+        u32 = ctypes.windll.user32
+        flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        for ev in self._EVENTS:
+            h = u32.SetWinEventHook(ev, ev, None, self._proc, 0, 0, flags)
+            if h:
+                self._hooks.append(h)
+
+    def stop(self):
+        u32 = ctypes.windll.user32
+        for h in self._hooks:
+            u32.UnhookWinEvent(h)
+        self._hooks = []
+
+    def active(self) -> bool:
+        return bool(self._hooks)
+
+
 class AppController(QtCore.QObject):
     status_changed = QtCore.Signal(str)
     rules_changed = QtCore.Signal(list)
     service_toggled = QtCore.Signal(bool)
+    procs_refreshed = QtCore.Signal(list)
+    config_saved = QtCore.Signal()
 
     def __init__(self):
         super().__init__()
-        self.cfg = Config()
-        self.config_data = copy.deepcopy(self.cfg.get())
+        self.cfg = current_config()
+        self.config_data = json.loads(json.dumps(self.cfg.get()))
+
+        # Event-driven updates: WinEvent hooks trigger repaints on real changes;
+        # the timer is only a slow safety-net sweep (>=2 s keeps timer resolution low).
+        self.winEvents = WinEventBridge(self)
 
-        # Timers that drive updates
         self.timer = QtCore.QTimer(self)
-        self.timer.setInterval(120)
+        self.timer.setInterval(2000)
         self.timer.setTimerType(QtCore.Qt.VeryCoarseTimer)
-        self.timer.timeout.connect(self._tick)
 
         self.animTimer = QtCore.QTimer(self)
         self.animTimer.setInterval(33)  # ~30 FPS
         self.animTimer.setTimerType(QtCore.Qt.CoarseTimer)
-        self.animTimer.timeout.connect(self._tick_anim)
+
+        # Maintained at mutation time so _rearm_anim_timer never rescans rules
+        self._anim_rule_count = self._count_anim_rules()
+        # Quantas janelas visíveis caíram em regra animada no último sweep
+        self._live_anim_count = 0
+        self._update_anim_cadence()
+        # Falhas dos ticks: contadas e logadas no máximo 1x por minuto
+        self._tick_errors = 0
+        self._last_tick_log = 0.0
+        # Closures dos ticks com config/apply presos como locais (menos
+        # LOAD_ATTR/LOAD_GLOBAL por frame no loop de 30 Hz)
+        self._tick_cb = None
+        self._tick_anim_cb = None
+        self._rebind_ticks()
+        # Linhas formatadas das regras; invalidada apenas quando regras mudam
+        self._rules_text_cache: List[str] | None = None
+        # Índice exe_lower -> posição da regra Process; refeito a cada mutação
+        self._process_rule_index: dict = {}
+        self._reindex_rules()
+        # Coalesce de emissões de rules_changed dentro do mesmo giro do loop
+        self._rules_emit_pending = False
+        # Coalesce de rearms do animTimer em mutações em lote
+        self._rearm_pending = False
+        # True enquanto a regra Global comprovadamente está única e no topo
+        self._global_is_on_top = False
+        # Cache (timestamp, nomes) da enumeração de processos + guarda do worker
+        self._procs_cache: Tuple[float, list] = (0.0, [])
+        self._procs_refreshing = False
+        # Saves serializados: um worker por vez; só o snapshot mais novo espera
+        self._save_running = False
+        self._save_pending: dict | None = None
+        # Últimos valores emitidos; evita re-render por emissões repetidas
+        self._last_status: str | None = None
+        self._service_state: bool | None = None
+        self._normalize_all_rules()
 
         # Start if enabled in config
         if self.config_data.get("service_enabled"):
@@ -45,57 +212,200 @@ class AppController(QtCore.QObject):
     def toggle_service(self, enabled: bool):
         self.config_data["service_enabled"] = bool(enabled)
         if enabled:
+            self.winEvents.start()
             if not self.timer.isActive():
                 self.timer.start()
             self._rearm_anim_timer()
             self._emit_status("Status: running")
         else:
+            self.winEvents.stop()
             if self.timer.isActive():
                 self.timer.stop()
             if self.animTimer.isActive():
                 self.animTimer.stop()
             self._emit_status("Status: stopped")
-        self.service_toggled.emit(bool(enabled))
+        enabled = bool(enabled)
+        if self._service_state != enabled:
+            self._service_state = enabled
+            self.service_toggled.emit(enabled)
 
-    def _tick(self):
-        try:
-            apply_colors_once(self.config_data, animated_only=False)
-        except Exception:
-            pass
+    def _update_anim_cadence(self):
+        """I tune animation cadence: smooth precise frames while some border is
+        actually animating on screen, relaxed coarse ticks otherwise (borders
+        keep animating with the window minimized to the tray)."""
+        interval = 16 if self._live_anim_count > 0 else 100
+        if self.animTimer.interval() == interval:
+            return
+        if interval == 16:
+            self.animTimer.setInterval(16)  # ~60 FPS
+            self.animTimer.setTimerType(QtCore.Qt.PreciseTimer)
+        else:
+            self.animTimer.setInterval(100)
+            self.animTimer.setTimerType(QtCore.Qt.VeryCoarseTimer)
+        # Com o animTimer ativo, o sweep completo pega carona a cada N frames
+        # (~2 s), mantendo um único stream de wakeups
+        self._sweep_every = max(1, 2000 // self.animTimer.interval())
+        self._anim_tick_count = 0
 
-    def _tick_anim(self):
-        try:
-            apply_colors_once(self.config_data, animated_only=True)
-        except Exception:
-            pass
+    def shutdown(self):
+        """I release the WinEvent hooks and stop timers before the app exits."""
+        self.winEvents.stop()
+        if self.timer.isActive():
+            self.timer.stop()
+        if self.animTimer.isActive():
+            self.animTimer.stop()
+
+    def _mk_tick(self, animated: bool):
+        apply = apply_colors_once
+        cfg = self.config_data
+        log_err = self._log_tick_error
+        if animated:
+            def _tick_anim():
+                # Validação barata antes do try: sem regras, sem trabalho
+                if not cfg.get("window_rules"):
+                    return
+                self._anim_tick_count += 1
+                if self._anim_tick_count >= self._sweep_every:
+                    # Frame N vira o sweep completo (estático + animado)
+                    self._anim_tick_count = 0
+                    self._tick_cb()
+                    return
+                try:
+                    apply(cfg, animated_only=True)
+                except (OSError, RuntimeError, ValueError):
+                    log_err()
+            return _tick_anim
+
+        rearm = self._rearm_anim_timer
+
+        def _tick():
+            if not cfg.get("window_rules"):
+                return
+            try:
+                n = apply(cfg, animated_only=False)
+            except (OSError, RuntimeError, ValueError):
+                log_err()
+                return
+            if n != self._live_anim_count:
+                # 0→n liga o animTimer; n→0 desliga (nada animado na tela)
+                self._live_anim_count = n
+                rearm()
+        return _tick
+
+    def _log_tick_error(self):
+        """I count tick failures and report at most once per minute."""
+        self._tick_errors += 1
+        now = time.monotonic()
+        if now - self._last_tick_log >= 60.0:
+            self._last_tick_log = now
+            print(
+                f"apply_colors_once failed {self._tick_errors}x in the last minute",
+                file=sys.stderr,
+            )
+            self._tick_errors = 0
+
+    def _rebind_ticks(self):
+        """I (re)create the tick closures; needed whenever config_data is replaced."""
+        if self._tick_cb is not None:
+            self.timer.timeout.disconnect(self._tick_cb)
+            self.winEvents.event_fired.disconnect(self._tick_cb)
+            self.animTimer.timeout.disconnect(self._tick_anim_cb)
+        self._tick_cb = self._mk_tick(False)
+        self._tick_anim_cb = self._mk_tick(True)
+        self.timer.timeout.connect(self._tick_cb)
+        self.winEvents.event_fired.connect(self._tick_cb, QtCore.Qt.QueuedConnection)
+        self.animTimer.timeout.connect(self._tick_anim_cb)
 
     def _emit_status(self, msg: str):
-        self.status_changed.emit(msg)
+        if msg != self._last_status:
+            self._last_status = msg
+            self.status_changed.emit(msg)
 
     def _emit_rules(self):
+        # Várias mutações no mesmo tick viram uma única emissão
+        if not self._rules_emit_pending:
+            self._rules_emit_pending = True
+            QtCore.QTimer.singleShot(0, self._flush_rules_emit)
+
+    def _flush_rules_emit(self):
+        self._rules_emit_pending = False
         self.rules_changed.emit(self.rules_text())
 
     def _has_anim(self) -> bool:
-        return any((r.get("animation", {}).get("type", "none") != "none")
-                   for r in self.config_data.get("window_rules", []))
+        return self._anim_rule_count > 0
+
+    @staticmethod
+    def _is_animated(r: dict) -> bool:
+        return ((r.get("animation") or {}).get("type") or "none") != "none"
+
+    def _count_anim_rules(self) -> int:
+        is_anim = self._is_animated
+        return sum(1 for r in self.config_data.get("window_rules", []) if is_anim(r))
+
+    def _recompute_anim_flag(self):
+        self._anim_rule_count = self._count_anim_rules()
+        self._reindex_rules()
+
+    def _reindex_rules(self):
+        # Config mudou: o cache regra-por-processo do model também está velho
+        invalidate_rule_cache()
+        idx = {}
+        for i, r in enumerate(self.config_data.get("window_rules", [])):
+            if r.get("_mt") == MatchType.PROCESS:
+                exe = r.get("_contains_lc") or ""
+                if exe and exe not in idx:
+                    idx[exe] = i
+        self._process_rule_index = idx
+
+    def _schedule_rearm(self):
+        # Mutações em lote disparam um único rearm no próximo giro do loop
+        if not self._rearm_pending:
+            self._rearm_pending = True
+            QtCore.QTimer.singleShot(0, self._do_rearm)
+
+    def _do_rearm(self):
+        self._rearm_pending = False
+        self._rearm_anim_timer()
 
     def _rearm_anim_timer(self):
-        if self._has_anim() and self.config_data.get("service_enabled"):
+        self._update_anim_cadence()
+        if self._has_anim() and self._live_anim_count > 0 \
+                and self.config_data.get("service_enabled"):
             if not self.animTimer.isActive():
+                self._anim_tick_count = 0
                 self.animTimer.start()
+            # O sweep roda como divisor do animTimer; pausa o stream de 2 s
+            if self.timer.isActive():
+                self.timer.stop()
         else:
             if self.animTimer.isActive():
                 self.animTimer.stop()
+            if self.config_data.get("service_enabled") and not self.timer.isActive():
+                self.timer.start()
 
     # ---------- Rules ----------
     def rules_text(self) -> List[str]:
-        ensure_single_global_on_top(self.config_data)
+        if self._rules_text_cache is None:
+            self._rules_text_cache = self._build_rules_text()
+        return self._rules_text_cache
+
+    def _ensure_global_on_top(self):
+        if not self._global_is_on_top:
+            ensure_single_global_on_top(self.config_data)
+            self._global_is_on_top = True
+
+    def _build_rules_text(self) -> List[str]:
+        self._ensure_global_on_top()
         rows = []
         for i, r in enumerate(self.config_data.get("window_rules", [])):
             num = i + 1
             rows.append(f"{num}. " + self._rule_to_text(r))
         return rows
 
+    def _invalidate_rules_cache(self):
+        self._rules_text_cache = None
+        self._global_is_on_top = False
+
     def _rule_to_text(self, r: dict) -> str:
         m = r.get("match", "")
         c = r.get("contains", "")
@@ -103,13 +413,17 @@ class AppController(QtCore.QObject):
         sp = (r.get("animation") or {}).get("speed", 1.0)
         ac = r.get("active_border_color", "")
         ic = r.get("inactive_border_color", "")
-        contains_part = f" contains='{c}'" if m.lower() != "global" and c else ""
+        contains_part = f" contains='{c}'" if r.get("_mt") != MatchType.GLOBAL and c else ""
         return f"[{m}]{contains_part} | active={ac} | inactive={ic} | anim={a}({sp})"
 
     def add_rule(self, rule: dict):
-        self.config_data["window_rules"].append(rule)
+        self.config_data["window_rules"].append(prime_rule(rule))
+        if self._is_animated(rule):
+            self._anim_rule_count += 1
+        self._invalidate_rules_cache()
         self._emit_rules()
-        self._rearm_anim_timer()
+        self._reindex_rules()
+        self._schedule_rearm()
 
     def edit_rule(self, index: int, new_rule: dict):
         if index < 0 or index >= len(self.config_data.get("window_rules", [])):
@@ -117,49 +431,58 @@ class AppController(QtCore.QObject):
 
         old = self.config_data["window_rules"][index]
 
+        prime_rule(new_rule)
         # Preserva 'contains' se for regra de processo e o campo vier vazio por engano
-        if (new_rule.get("match", "").lower() == "process") and not new_rule.get("contains"):
+        if new_rule["_mt"] == MatchType.PROCESS and not new_rule.get("contains"):
             new_rule["contains"] = old.get("contains", "")
+            new_rule["_contains_lc"] = (new_rule["contains"] or "").strip().lower()
 
         self.config_data["window_rules"][index] = new_rule
+        self._anim_rule_count += int(self._is_animated(new_rule)) - int(self._is_animated(old))
+        self._invalidate_rules_cache()
         self._emit_rules()
-        self._rearm_anim_timer()
+        self._reindex_rules()
+        self._schedule_rearm()
 
     def remove_rule(self, index: int) -> str:
         if index < 0 or index >= len(self.config_data.get("window_rules", [])):
             return ""
         r = self.config_data["window_rules"][index]
-        if (r.get("match") or "").lower() == "global":
+        if r.get("_mt") == MatchType.GLOBAL:
             return "A regra Global é fixa e não pode ser removida."
         del self.config_data["window_rules"][index]
+        if self._is_animated(r):
+            self._anim_rule_count -= 1
+        self._invalidate_rules_cache()
         self._emit_rules()
-        self._rearm_anim_timer()
+        self._reindex_rules()
+        self._schedule_rearm()
         return ""
 
     def duplicate_rule(self, index: int) -> str:
         if index < 0 or index >= len(self.config_data.get("window_rules", [])):
             return ""
         r = self.config_data["window_rules"][index]
-        if (r.get("match") or "").lower() == "global":
+        if r.get("_mt") == MatchType.GLOBAL:
             return "A regra Global não pode ser duplicada."
-        self.config_data["window_rules"].append(copy.deepcopy(r))
+        self.config_data["window_rules"].append(_clone_rule(r))
+        if self._is_animated(r):
+            self._anim_rule_count += 1
+        self._invalidate_rules_cache()
         self._emit_rules()
-        self._rearm_anim_timer()
+        self._reindex_rules()
+        self._schedule_rearm()
         return ""
 
     def get_rule(self, index: int) -> dict | None:
         rules = self.config_data.get("window_rules", [])
         if 0 <= index < len(rules):
-            return copy.deepcopy(rules[index])
+            return _clone_rule(rules[index])
         return None
 
     # ---------- Process helpers ----------
     def find_process_rule(self, exe: str) -> int:
-        exe_l = (exe or "").strip().lower()
-        for i, r in enumerate(self.config_data.get("window_rules", [])):
-            if (r.get("match") or "").lower() == "process" and (r.get("contains") or "").strip().lower() == exe_l:
-                return i
-        return -1
+        return self._process_rule_index.get((exe or "").strip().lower(), -1)
 
     def add_or_warn_process_rule(self, exe: str, active="#FF0000", inactive="#0000FF") -> str:
         exe = (exe or "").strip()
@@ -167,42 +490,118 @@ class AppController(QtCore.QObject):
             return ""
         if self.find_process_rule(exe) != -1:
             return f"Já existe uma regra para o processo '{exe}'. Edite-a na aba Service."
-        r = {
+        r = prime_rule({
             "match": "Process",
             "contains": exe,
             "active_border_color": active,
             "inactive_border_color": inactive,
             "animation": {"type": "none", "speed": 1.0}
-        }
+        })
         self.config_data["window_rules"].append(r)
+        self._invalidate_rules_cache()
         self._emit_rules()
-        self._rearm_anim_timer()
+        self._reindex_rules()
+        self._schedule_rearm()
         return ""
 
     # ---------- Lists ----------
+    _PROCS_TTL = 2.0  # segundos
+
     def refresh_lists(self) -> Tuple[list, list]:
-        procs = list_process_names()
-        wins_disp = []
-        for hwnd, title, cls, proc in list_visible_windows():
-            wins_disp.append(f"{title}  |  {cls}  |  {proc}  | hwnd={hwnd}")
-        return procs, wins_disp
+        """I return cached process names and raw (hwnd, title, class, proc) window
+        tuples; a stale process list is re-enumerated on a worker thread and
+        delivered later via procs_refreshed."""
+        ts, procs = self._procs_cache
+        if time.monotonic() - ts >= self._PROCS_TTL and not self._procs_refreshing:
+            self._procs_refreshing = True
+            QtCore.QThreadPool.globalInstance().start(_ProcListWorker(self))
+        return procs, list_visible_windows()
+
+    @QtCore.Slot(list)
+    def _on_procs_listed(self, names: list):
+        self._procs_refreshing = False
+        self._procs_cache = (time.monotonic(), names)
+        self.procs_refreshed.emit(names)
 
     # ---------- Persistence ----------
     def reload_config(self):
         self.cfg.reload()
-        self.config_data = copy.deepcopy(self.cfg.get())
+        self.config_data = json.loads(json.dumps(self.cfg.get()))
+        self._rebind_ticks()
+        self._normalize_all_rules()
+        self._recompute_anim_flag()
+        self._invalidate_rules_cache()
         self._emit_rules()
         # Respect service flag on reload
         self.toggle_service(bool(self.config_data.get("service_enabled")))
 
     def save_config(self):
-        # Normalize colors and enforce invariants
+        # Só regras sujas são renormalizadas (O(sujas), não O(todas))
+        self._normalize_dirty_rules()
+        self._invalidate_rules_cache()
+        self._ensure_global_on_top()
+        # Escrita roda fora da thread da GUI, sobre um snapshot
+        snapshot = json.loads(json.dumps(self.config_data))
+        for r in snapshot.get("window_rules", []):
+            for k in [k for k in r if k.startswith("_")]:
+                del r[k]
+        if self._save_running:
+            # Dois workers simultâneos disputariam o mesmo .tmp/os.replace;
+            # o snapshot mais novo substitui o que estava na fila
+            self._save_pending = snapshot
+        else:
+            self._start_save(snapshot)
+        self._recompute_anim_flag()
+        self._schedule_rearm()
+
+    def _start_save(self, snapshot: dict):
+        self._save_running = True
+        QtCore.QThreadPool.globalInstance().start(_SaveWorker(self, snapshot))
+
+    def _save_finished(self):
+        self._save_running = False
+        pending, self._save_pending = self._save_pending, None
+        if pending is not None:
+            self._start_save(pending)
+
+    @staticmethod
+    def _normalize_rule_colors(r: dict):
+        for k in ("active_border_color", "inactive_border_color"):
+            v = r.get(k, "")
+            if isinstance(v, str) and v.lower() not in ("default", "none"):
+                r[k] = normalize_hex(v)
+
+    def _normalize_all_rules(self):
         for r in self.config_data.get("window_rules", []):
-            for k in ("active_border_color", "inactive_border_color"):
-                v = r.get(k, "")
-                if isinstance(v, str) and v.lower() not in ("default", "none"):
-                    r[k] = normalize_hex(v)
-        ensure_single_global_on_top(self.config_data)
-        self.cfg.set(self.config_data)
-        self.cfg.save()
-        self._rearm_anim_timer()
+            prime_rule(r)
+            self._normalize_rule_colors(r)
+            r["_clean"] = True
+
+    def _normalize_dirty_rules(self):
+        # Mutadores trocam o objeto da regra e o novo dict nasce sem a marca
+        # _clean; o save só renormaliza esses (a marca some na serialização
+        # junto com as demais chaves _*)
+        for r in self.config_data.get("window_rules", []):
+            if not r.get("_clean"):
+                self._normalize_rule_colors(r)
+                r["_clean"] = True
+
+    @QtCore.Slot()
+    def _on_save_done(self):
+        self._save_finished()
+        # O aviso transitório fica por conta da view (via config_saved); o
+        # status fixo segue mostrando running/stopped. Um save que deu certo
+        # também limpa um aviso de falha anterior.
+        if self._last_status == "Status: config save failed":
+            self._emit_status(
+                "Status: running"
+                if self.config_data.get("service_enabled")
+                else "Status: stopped"
+            )
+        self.config_saved.emit()
+
+    @QtCore.Slot(str)
+    def _on_save_failed(self, err: str):
+        self._save_finished()
+        print(f"config save failed: {err}", file=sys.stderr)
+        self._emit_status("Status: config save failed")
@@ -2,15 +2,23 @@ import os
 import time
 import json
 import math
+import array
 import ctypes
-import psutil
+import hashlib
+import itertools
 import ctypes.wintypes as wt
 
-import win32gui
 import win32con
 
+from enum import IntEnum
 from typing import Tuple, Dict, Optional, List
 
+
+class MatchType(IntEnum):
+    """I encode the rule match kind as an int for cheap hot-path comparisons."""
+    GLOBAL = 0
+    PROCESS = 1
+
 # ---------- DWM constants ----------
 DWMWA_BORDER_COLOR = 34  # COLORREF (DWORD)
 DWMWA_COLOR_DEFAULT = 0xFFFFFFFF
@@ -34,8 +42,52 @@ u32.GetWindowThreadProcessId.restype = wt.DWORD
 u32.IsWindowVisible.argtypes = [wt.HWND]
 u32.IsWindowVisible.restype = wt.BOOL
 u32.GetForegroundWindow.restype = wt.HWND
+u32.GetWindowTextW.argtypes = [wt.HWND, ctypes.c_wchar_p, ctypes.c_int]
+u32.GetWindowTextW.restype = ctypes.c_int
+u32.GetClassNameW.argtypes = [wt.HWND, ctypes.c_wchar_p, ctypes.c_int]
+u32.GetClassNameW.restype = ctypes.c_int
+u32.GetWindowLongW.argtypes = [wt.HWND, ctypes.c_int]
+u32.GetWindowLongW.restype = wt.LONG
+u32.GetWindowTextLengthW.argtypes = [wt.HWND]
+u32.GetWindowTextLengthW.restype = ctypes.c_int
+
+# Buffers reutilizados pelos callbacks de enumeração (somente thread da GUI),
+# evitando uma alocação por janela nas chamadas de título/classe.
+_title_buf = ctypes.create_unicode_buffer(512)
+_class_buf = ctypes.create_unicode_buffer(256)
+
+# Enumeração em duas fases: um callback mínimo só acumula os hwnds num array C
+# (uma travessia C->Python barata por janela) e a decisão roda depois num loop
+# Python com os bindings já resolvidos.
+_WNDENUMPROC = ctypes.WINFUNCTYPE(wt.BOOL, wt.HWND, wt.LPARAM)
+u32.EnumWindows.argtypes = [_WNDENUMPROC, wt.LPARAM]
+u32.EnumWindows.restype = wt.BOOL
+
+_MAX_HWNDS = 2048
+_hwnd_arr = (ctypes.c_void_p * _MAX_HWNDS)()
+_hwnd_n = ctypes.c_int(0)
+
+@_WNDENUMPROC
+def _collect_hwnd(hwnd, _):
+    n = _hwnd_n.value
+    if n < _MAX_HWNDS:
+        _hwnd_arr[n] = hwnd
+        _hwnd_n.value = n + 1
+    return True
+
+def _snapshot_hwnds() -> int:
+    """I fill _hwnd_arr with all top-level hwnds and return how many there are."""
+    _hwnd_n.value = 0
+    u32.EnumWindows(_collect_hwnd, 0)
+    return _hwnd_n.value
 
 _DwmSetWindowAttribute = dwm.DwmSetWindowAttribute
+_DwmSetWindowAttribute.argtypes = [wt.HWND, wt.DWORD, ctypes.c_void_p, wt.DWORD]
+_DwmSetWindowAttribute.restype = ctypes.c_long
+
+# COLORREF reutilizado: com argtypes definidos, ints passam direto e o único
+# objeto ctypes do caminho quente é este buffer (thread da GUI apenas).
+_color_buf = ctypes.c_uint32(0)
 
 
 # ---------- Color helpers ----------
@@ -50,10 +102,15 @@ def hex_to_colorref(value: str) -> int:
         return DWMWA_COLOR_NONE
     if v.startswith("#"):
         v = v[1:]
-    if len(v) != 6 or any(c not in "0123456789abcdef" for c in v):
+    if len(v) != 6:
         return COLOR_INVALID
-    bgr = int(v[4:6] + v[2:4] + v[0:2], 16)
-    return bgr
+    # int(v, 16) sozinho aceita "0x...", "+...", "-..." e "_"; o strip() em C
+    # barra qualquer caractere fora de [0-9a-f] antes do fast path
+    if v.strip("0123456789abcdef"):
+        return COLOR_INVALID
+    rgb = int(v, 16)
+    # RGB -> COLORREF (BGR) por bit ops, sem refatiar a string
+    return ((rgb & 0xFF) << 16) | (rgb & 0x00FF00) | (rgb >> 16)
 
 def colorref_to_hex(colorref: int) -> str:
     """I convert a COLORREF (BGR) back into a "#RRGGBB" string (best-effort)."""
@@ -77,17 +134,29 @@ def normalize_hex(s: str) -> str:
         return "#000000"
     return s.upper()
 
+def prime_rule(r: dict) -> dict:
+    """I cache lowercase match/contains and the match score on the rule so the
+    hot matching path reads plain dict fields instead of re-lowercasing."""
+    r["_match_lc"] = (r.get("match") or "").lower()
+    r["_contains_lc"] = (r.get("contains") or "").strip().lower()
+    r["_score"] = 3 if r["_match_lc"] == "process" else 0
+    if r["_match_lc"] == "process":
+        r["_mt"] = MatchType.PROCESS
+    elif r["_match_lc"] == "global":
+        r["_mt"] = MatchType.GLOBAL
+    else:
+        r["_mt"] = None
+    r["_a_rgb"] = _hex_to_rgb_int(r.get("active_border_color"))
+    r["_i_rgb"] = _hex_to_rgb_int(r.get("inactive_border_color"))
+    return r
+
 # ---------- Config ----------
 class Config:
     """I load, validate, expose, and save the app configuration atomically."""
-    _instance = None
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._data = None
-            cls._instance._load()
-        return cls._instance
+    def __init__(self):
+        self._data = None
+        self._load()
 
     def _default(self) -> dict:
         return {
@@ -106,12 +175,16 @@ class Config:
 
     def _load(self):
         try:
+            st = os.stat(CONFIG_PATH)
+            self._mtime_ns, self._size = st.st_mtime_ns, st.st_size
             with open(CONFIG_PATH, "r", encoding="utf-8") as f:
                 self._data = json.load(f)
         except FileNotFoundError:
             self._data = self._default()
+            self._mtime_ns = self._size = None
         except Exception:
             self._data = self._default()
+            self._mtime_ns = self._size = None
 
         self._data.setdefault("animation", {"type": "none", "speed": 1.0})
         self._data.setdefault("service_enabled", False)
@@ -142,6 +215,10 @@ class Config:
             g = self._data["window_rules"].pop(g_idx)
             self._data["window_rules"].insert(0, g)
 
+        for r in self._data["window_rules"]:
+            prime_rule(r)
+        invalidate_rule_cache()
+
     def get(self) -> dict:
         """I give back the current in-memory config dict."""
         return self._data
@@ -149,50 +226,108 @@ class Config:
     def set(self, data: dict):
         """I replace the in-memory config with a new dict (already validated by caller)."""
         self._data = data
+        for r in self._data.get("window_rules", []) or []:
+            prime_rule(r)
+        invalidate_rule_cache()
 
     def save(self):
-        """I save the config to disk atomically, avoiding partial writes."""
+        """I save the config to disk atomically, skipping writes when nothing changed."""
+        data = dict(self._data)
+        # Campos sombra ("_match_lc" etc.) são derivados; ficam fora do disco
+        data["window_rules"] = [
+            {k: v for k, v in r.items() if not k.startswith("_")}
+            for r in (self._data.get("window_rules") or [])
+        ]
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == getattr(self, "_last_saved_hash", None):
+            return  # conteúdo idêntico ao último save; poupa o disco
         tmp = CONFIG_PATH + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, CONFIG_PATH)
+        self._last_saved_hash = digest
+        try:
+            st = os.stat(CONFIG_PATH)
+            self._mtime_ns, self._size = st.st_mtime_ns, st.st_size
+        except OSError:
+            pass
 
     def reload(self):
-        """I reload config from disk and re-apply invariants."""
+        """I reload config from disk, skipping the parse when the file is unchanged."""
+        try:
+            st = os.stat(CONFIG_PATH)
+            if (st.st_mtime_ns, st.st_size) == (self._mtime_ns, self._size):
+                return
+        except OSError:
+            pass
         self._load()
 
+# Instância única do processo, sem o hack de __new__: quem precisa pede via
+# current_config(); o caminho quente continua recebendo o dict como argumento.
+_cfg: Optional[Config] = None
+
+def current_config() -> Config:
+    """I return the process-wide Config, creating it on first use."""
+    global _cfg
+    if _cfg is None:
+        _cfg = Config()
+    return _cfg
+
 # ---------- Animations ----------
+# Seno tabelado (1024 entradas): troca a chamada libm por um índice mascarado
+# nos waveforms chamados a cada frame.
+_SIN_LUT = array.array("d", (math.sin(2.0 * math.pi * i / 1024.0) for i in range(1024)))
+_SIN_SCALE = 1024.0 / (2.0 * math.pi)
+
+def _fast_sin(x: float) -> float:
+    return _SIN_LUT[int(x * _SIN_SCALE) & 1023]
+
+
 class Animation:
     """I maintain per-key animation state and produce animated color values (RGB int)."""
-    _state: Dict[str, dict] = {}  # key -> {"time": float, "current": int, "last_pass": int}
+    # Estado em arrays paralelos (SoA) indexados por slot: três arrays C
+    # compactos no lugar de um dict interno por chave.
+    _key_to_id: Dict[str, int] = {}
+    _time = array.array("d")       # tempo acumulado por slot
+    _current = array.array("L")    # última cor RGB produzida
+    _last_pass = array.array("q")  # último pass_id que avançou o slot
 
     @staticmethod
-    def _get_state(key: str) -> dict:
-        s = Animation._state.get(key)
-        if not s:
-            s = {"time": 0.0, "current": 0xFF0000, "last_pass": -1}
-            Animation._state[key] = s
-        return s
+    def _slot(key: str) -> int:
+        sid = Animation._key_to_id.get(key)
+        if sid is None:
+            sid = len(Animation._time)
+            Animation._key_to_id[key] = sid
+            Animation._time.append(0.0)
+            Animation._current.append(0xFF0000)
+            Animation._last_pass.append(-1)
+        return sid
 
     @staticmethod
-    def _advance(st: dict, speed: float, scale: float, pass_id: int):
+    def _advance(sid: int, speed: float, scale: float, pass_id: int) -> float:
         """Avança o tempo no máximo 1x por 'passo' (chamada de apply_colors_once)."""
-        if st.get("last_pass") != pass_id:
-            st["time"] += max(0.1, float(speed)) * float(scale)
-            st["last_pass"] = pass_id
+        if Animation._last_pass[sid] != pass_id:
+            Animation._time[sid] += max(0.1, float(speed)) * float(scale)
+            Animation._last_pass[sid] = pass_id
+        return Animation._time[sid]
 
     @staticmethod
     def _lerp_rgb(a: Optional[int], b: Optional[int], t: float) -> int:
+        # SWAR: interpola R/B num lane e G no outro (2 multiplicações, sem
+        # desempacotar canais; erro máximo de 1 por canal, invisível na borda)
         if a is None:
             a = 0xFF0000
         if b is None:
             b = 0x0000FF
-        ar, ag, ab = (a >> 16) & 0xFF, (a >> 8) & 0xFF, a & 0xFF
-        br, bg, bb = (b >> 16) & 0xFF, (b >> 8) & 0xFF, b & 0xFF
-        r = int(ar + (br - ar) * t)
-        g = int(ag + (bg - ag) * t)
-        b = int(ab + (bb - ab) * t)
-        return (r << 16) | (g << 8) | b
+        ti = int(t * 256)
+        a_rb = a & 0xFF00FF
+        a_g = a & 0x00FF00
+        rb = (a_rb + ((((b & 0xFF00FF) - a_rb) * ti) >> 8)) & 0xFF00FF
+        g = (a_g + ((((b & 0x00FF00) - a_g) * ti) >> 8)) & 0x00FF00
+        return rb | g
 
     @staticmethod
     def color_for(
@@ -203,49 +338,31 @@ class Animation:
         end_rgb: Optional[int] = None,
         pass_id: int = 0,
     ) -> Optional[int]:
-        anim_type = (anim_type or "none").lower()
-        if anim_type == "none":
-            return None
-        if anim_type == "rainbow":
-            return Animation._rainbow(key, speed, pass_id)
-        if anim_type == "pulse":
-            return Animation._pulse(key, speed, start_rgb, end_rgb, pass_id)
-        if anim_type == "fade":
-            return Animation._fade(key, speed, start_rgb, end_rgb, pass_id)
-        if anim_type == "breath":
-            return Animation._breath(key, speed, start_rgb, pass_id)
-        if anim_type == "tri":
-            return Animation._tri(key, speed, start_rgb, end_rgb, pass_id)
-        if anim_type == "sparkle":
-            return Animation._sparkle(key, speed, start_rgb, pass_id)
-        if anim_type == "steps":
-            return Animation._steps(key, speed, start_rgb, end_rgb, steps=3, pass_id=pass_id)
-        return None
+        fn = Animation._DISPATCH.get((anim_type or "none").lower())
+        return fn(key, speed, start_rgb, end_rgb, pass_id) if fn else None
 
     @staticmethod
     def _rainbow(key: str, speed: float, pass_id: int = 0) -> int:
-        st = Animation._get_state(key)
-        Animation._advance(st, speed, 1.0, pass_id)
-        r = (st["current"] >> 16) & 0xFF
-        g = (st["current"] >> 8) & 0xFF
-        b = st["current"] & 0xFF
-        step = max(1, int(speed * 5))
-        if r == 0xFF and g < 0xFF and b == 0x00:
-            g = min(0xFF, g + step)
-        elif g == 0xFF and r > 0x00 and b == 0x00:
-            r = max(0x00, r - step)
-        elif g == 0xFF and b < 0xFF and r == 0x00:
-            b = min(0xFF, b + step)
-        elif b == 0xFF and g > 0x00 and r == 0x00:
-            g = max(0x00, g - step)
-        elif b == 0xFF and r < 0xFF and g == 0x00:
-            r = min(0xFF, r + step)
-        elif r == 0xFF and b > 0x00 and g == 0x00:
-            b = max(0x00, b - step)
-        else:
-            r, g, b = 0xFF, 0x00, 0x00
-        st["current"] = (r << 16) | (g << 8) | b
-        return st["current"]
+        sid = Animation._slot(key)
+        t = Animation._advance(sid, speed, 1.0, pass_id)
+        # Fase contínua no hexágono de matiz: substitui a cadeia de 6 branches
+        # e elimina os estados fora do hexágono que resetavam para vermelho.
+        # 0.02 ~ passo antigo de speed*5 por canal (6*255 unidades por volta).
+        hue = (t * 0.02) % 6.0
+        sector = int(hue)
+        c = int((hue - sector) * 255)
+        x = 255 - c
+        r, g, b = (
+            (0xFF, c, 0x00),
+            (x, 0xFF, 0x00),
+            (0x00, 0xFF, c),
+            (0x00, x, 0xFF),
+            (c, 0x00, 0xFF),
+            (0xFF, 0x00, x),
+        )[sector]
+        cur = (r << 16) | (g << 8) | b
+        Animation._current[sid] = cur
+        return cur
 
     @staticmethod
     def _pulse(
@@ -255,11 +372,11 @@ class Animation:
         b: Optional[int] = None,
         pass_id: int = 0,
     ) -> int:
-        st = Animation._get_state(key)
-        Animation._advance(st, speed, 0.05, pass_id)
-        t = (math.sin(st["time"]) + 1) / 2.0
-        st["current"] = Animation._lerp_rgb(a, b, t)
-        return st["current"]
+        sid = Animation._slot(key)
+        t = (_fast_sin(Animation._advance(sid, speed, 0.05, pass_id)) + 1) / 2.0
+        cur = Animation._lerp_rgb(a, b, t)
+        Animation._current[sid] = cur
+        return cur
 
     @staticmethod
     def _fade(
@@ -269,11 +386,11 @@ class Animation:
         b: Optional[int] = None,
         pass_id: int = 0,
     ) -> int:
-        st = Animation._get_state(key)
-        Animation._advance(st, speed, 0.02, pass_id)
-        t = (math.sin(st["time"]) + 1) / 2.0
-        st["current"] = Animation._lerp_rgb(a, b, t)
-        return st["current"]
+        sid = Animation._slot(key)
+        t = (_fast_sin(Animation._advance(sid, speed, 0.02, pass_id)) + 1) / 2.0
+        cur = Animation._lerp_rgb(a, b, t)
+        Animation._current[sid] = cur
+        return cur
 
     @staticmethod
     def _triangle_wave(x: float) -> float:
@@ -292,12 +409,12 @@ class Animation:
 
     @staticmethod
     def _breath(key: str, speed: float, a: Optional[int], pass_id: int = 0) -> int:
-        st = Animation._get_state(key)
-        Animation._advance(st, speed, 0.03, pass_id)
-        amp = 0.35 * (0.5 + 0.5 * math.sin(st["time"]))
+        sid = Animation._slot(key)
+        amp = 0.35 * (0.5 + 0.5 * _fast_sin(Animation._advance(sid, speed, 0.03, pass_id)))
         base = a if a is not None else 0xFF0000
-        st["current"] = Animation._lighten(base, amp)
-        return st["current"]
+        cur = Animation._lighten(base, amp)
+        Animation._current[sid] = cur
+        return cur
 
     @staticmethod
     def _tri(
@@ -307,24 +424,25 @@ class Animation:
         b: Optional[int],
         pass_id: int = 0
     ) -> int:
-        st = Animation._get_state(key)
-        Animation._advance(st, speed, 0.06, pass_id)
-        t = Animation._triangle_wave(st["time"])
-        st["current"] = Animation._lerp_rgb(a, b, t)
-        return st["current"]
+        sid = Animation._slot(key)
+        t = Animation._triangle_wave(Animation._advance(sid, speed, 0.06, pass_id))
+        cur = Animation._lerp_rgb(a, b, t)
+        Animation._current[sid] = cur
+        return cur
 
     @staticmethod
     def _sparkle(key: str, speed: float, a: Optional[int], pass_id: int = 0) -> int:
-        st = Animation._get_state(key)
-        Animation._advance(st, speed, 0.05, pass_id)
+        sid = Animation._slot(key)
+        t = Animation._advance(sid, speed, 0.05, pass_id)
         base = a if a is not None else 0xFF0000
-        w1 = 0.5 + 0.5 * math.sin(st["time"] * 1.7)
-        w2 = 0.5 + 0.5 * math.sin(st["time"] * 2.3 + 1.234)
+        w1 = 0.5 + 0.5 * _fast_sin(t * 1.7)
+        w2 = 0.5 + 0.5 * _fast_sin(t * 2.3 + 1.234)
         jitter = (w1 * 0.6 + w2 * 0.4)
         up = Animation._lighten(base, 0.15 * jitter)
         down = Animation._darken(base, 0.15 * (1.0 - jitter))
-        st["current"] = Animation._lerp_rgb(down, up, 0.5)
-        return st["current"]
+        cur = Animation._lerp_rgb(down, up, 0.5)
+        Animation._current[sid] = cur
+        return cur
 
     @staticmethod
     def _steps(
@@ -336,19 +454,33 @@ class Animation:
         pass_id: int = 0
     ) -> int:
         steps = max(2, int(steps))
-        st = Animation._get_state(key)
-        Animation._advance(st, speed, 0.04, pass_id)
-        t = (math.sin(st["time"]) + 1) * 0.5
+        sid = Animation._slot(key)
+        t = (_fast_sin(Animation._advance(sid, speed, 0.04, pass_id)) + 1) * 0.5
         q = round(t * (steps - 1)) / (steps - 1)
-        st["current"] = Animation._lerp_rgb(a, b, q)
-        return st["current"]
+        cur = Animation._lerp_rgb(a, b, q)
+        Animation._current[sid] = cur
+        return cur
+
 
+# Despacho O(1) por tipo; assinatura uniforme (key, speed, start, end, pass_id)
+Animation._DISPATCH = {
+    "rainbow": lambda k, s, a, b, p: Animation._rainbow(k, s, p),
+    "pulse":   lambda k, s, a, b, p: Animation._pulse(k, s, a, b, p),
+    "fade":    lambda k, s, a, b, p: Animation._fade(k, s, a, b, p),
+    "breath":  lambda k, s, a, b, p: Animation._breath(k, s, a, p),
+    "tri":     lambda k, s, a, b, p: Animation._tri(k, s, a, b, p),
+    "sparkle": lambda k, s, a, b, p: Animation._sparkle(k, s, a, p),
+    "steps":   lambda k, s, a, b, p: Animation._steps(k, s, a, b, steps=3, pass_id=p),
+}
 
 
 # ---------- PID/name caches for performance ----------
+_pass_counter = itertools.count(1)  # passo global de apply_colors_once
+
 _pid_name_cache: Dict[int, str] = {}
 _pid_last_seen: Dict[int, float] = {}
 _last_colors: Dict[int, int] = {}  # hwnd -> COLORREF
+_last_fg: int = 0  # foreground do passo anterior; só ele e o novo mudam de cor
 
 def _gc_pid_cache(max_age: int = 60):
     """I evict stale PID->name cache entries to keep memory bounded."""
@@ -358,8 +490,57 @@ def _gc_pid_cache(max_age: int = 60):
         _pid_last_seen.pop(pid, None)
         _pid_name_cache.pop(pid, None)
 
+# Snapshot Toolhelp: um burst de syscalls preenche o cache pid->nome inteiro,
+# em vez de um OpenProcess/QueryFullProcessImageNameW por miss.
+TH32CS_SNAPPROCESS = 0x00000002
+_INVALID_HANDLE_VALUE = wt.HANDLE(-1).value
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wt.DWORD),
+        ("cntUsage", wt.DWORD),
+        ("th32ProcessID", wt.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wt.DWORD),
+        ("cntThreads", wt.DWORD),
+        ("th32ParentProcessID", wt.DWORD),
+        ("pcPriClassBase", wt.LONG),
+        ("dwFlags", wt.DWORD),
+        ("szExeFile", ctypes.c_wchar * 260),
+    ]
+
+k32.CreateToolhelp32Snapshot.argtypes = [wt.DWORD, wt.DWORD]
+k32.CreateToolhelp32Snapshot.restype = wt.HANDLE
+k32.Process32FirstW.argtypes = [wt.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+k32.Process32FirstW.restype = wt.BOOL
+k32.Process32NextW.argtypes = [wt.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+k32.Process32NextW.restype = wt.BOOL
+
+_miss_streak = 0  # misses consecutivos no cache pid->nome
+
+def _snapshot_pid_names() -> Dict[int, str]:
+    """I walk a Toolhelp process snapshot and refill the PID->name cache in bulk."""
+    out: Dict[int, str] = {}
+    h = k32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not h or h == _INVALID_HANDLE_VALUE:
+        return out
+    try:
+        e = PROCESSENTRY32W()
+        e.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        now = time.time()
+        ok = k32.Process32FirstW(h, ctypes.byref(e))
+        while ok:
+            pid, name = e.th32ProcessID, e.szExeFile
+            out[pid] = name
+            _pid_name_cache[pid] = name
+            _pid_last_seen[pid] = now
+            ok = k32.Process32NextW(h, ctypes.byref(e))
+    finally:
+        k32.CloseHandle(h)
+    return out
+
 def _query_process_name_native(pid: int) -> str:
-    """I try to read the executable name via QueryFullProcessImageNameW, fallback to psutil."""
+    """I read the executable name via QueryFullProcessImageNameW (empty string on failure)."""
     PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
     h = k32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
     if h:
@@ -370,17 +551,24 @@ def _query_process_name_native(pid: int) -> str:
                 return (buf.value.rsplit("\\", 1)[-1]).strip()
         finally:
             k32.CloseHandle(h)
-    try:
-        return psutil.Process(pid).name()
-    except Exception:
-        return ""
+    return ""
 
 def get_process_name_fast(pid: int) -> str:
     """I return a cached process name if present; otherwise I resolve and cache it."""
+    global _miss_streak
     name = _pid_name_cache.get(pid)
     if name is not None:
+        _miss_streak = 0
         _pid_last_seen[pid] = time.time()
         return name
+    _miss_streak += 1
+    if _miss_streak >= 8:
+        # Muitos misses seguidos (ex.: pós-startup): um snapshot resolve todos
+        _miss_streak = 0
+        _snapshot_pid_names()
+        name = _pid_name_cache.get(pid)
+        if name is not None:
+            return name
     name = _query_process_name_native(pid) or ""
     _pid_name_cache[pid] = name
     _pid_last_seen[pid] = time.time()
@@ -389,43 +577,46 @@ def get_process_name_fast(pid: int) -> str:
 def get_process_name(hwnd) -> str:
     """I resolve the process name for a given window handle."""
     pid = wt.DWORD()
-    u32.GetWindowThreadProcessId(wt.HWND(hwnd), ctypes.byref(pid))
+    u32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
     return get_process_name_fast(pid.value)
 
 # ---------- Rule matching ----------
 def _score_rule(rule: dict) -> int:
     """I rank rules. Process beats Global. Higher score wins."""
-    m = (rule.get("match") or "").lower()
-    if m == "process":
-        return 3
-    if m == "global":
-        return 0
-    return 0
+    return rule.get("_score", 0)
 
 def _matches(rule: dict, title: str, class_name: str, process_name: str) -> bool:
     """I check whether a rule matches the current window context. Only Global or Process."""
-    m = (rule.get("match") or "").lower()
-    contains = (rule.get("contains") or "").lower()
-    if m == "global":
+    mt = rule.get("_mt")
+    if mt == MatchType.GLOBAL:
         return True
-    if m == "process":
-        return contains in (process_name or "").lower()
+    if mt == MatchType.PROCESS:
+        return (rule.get("_contains_lc") or "") in (process_name or "").lower()
     return False
 
+# Regras pré-separadas (Process ordenadas por contains mais longo primeiro,
+# Global à parte): [já computado?, tupla de Process, Global ou None].
+# Como Process (score 3) sempre vence Global (0), o primeiro hit já é o melhor.
+_rule_split_state: list = [False, (), None]
+
+def _split_rules(config: dict):
+    rules = config.get("window_rules", []) or []
+    procs = [r for r in rules if r.get("_mt") == MatchType.PROCESS]
+    procs.sort(key=lambda r: -len(r.get("_contains_lc") or ""))
+    glob = next((r for r in rules if r.get("_mt") == MatchType.GLOBAL), None)
+    _rule_split_state[0] = True
+    _rule_split_state[1] = tuple(procs)
+    _rule_split_state[2] = glob
+
 def pick_rule(config: dict, title: str, class_name: str, process_name: str) -> Optional[dict]:
     """I scan configured rules and return the best match for this window."""
-    rules = config.get("window_rules", []) or []
-    best = None
-    best_score = -1
-    for r in rules:
-        if _matches(r, title, class_name, process_name):
-            sc = _score_rule(r)
-            contains_len = len((r.get("contains") or ""))
-            key = (sc, contains_len)
-            if key > (best_score, len((best or {}).get("contains") or "")):
-                best = r
-                best_score = sc
-    return best
+    if not _rule_split_state[0]:
+        _split_rules(config)
+    proc_lc = (process_name or "").lower()
+    for r in _rule_split_state[1]:
+        if (r.get("_contains_lc") or "") in proc_lc:
+            return r
+    return _rule_split_state[2]
 
 # ---------- Color resolution ----------
 def resolve_colors(rule: Optional[dict], defaults: dict) -> Tuple[int, int, dict]:
@@ -447,6 +638,62 @@ def resolve_colors(rule: Optional[dict], defaults: dict) -> Tuple[int, int, dict
 
     return active, inactive, {"type": "none", "speed": 1.0}
 
+# ---------- Per-process rule resolution cache ----------
+# process_name -> (rule, active, inactive, anim, key, a_rgb, i_rgb); evitando
+# pick_rule + resolve_colors por janela a cada frame. Limpo quando config muda.
+_rule_cache: Dict[str, tuple] = {}
+
+# Avaliação parcial do formato mais comum de config (só a regra Global,
+# estática): [já computado?, (active, inactive) ou None]
+_fast_static_state: list = [False, None]
+
+def _compute_fast_static(config: dict) -> Optional[tuple]:
+    """I return the precomputed (active, inactive) COLORREF pair when the config
+    is exactly one static Global rule, else None."""
+    rules = config.get("window_rules") or []
+    if len(rules) != 1:
+        return None
+    r = rules[0]
+    if r.get("_mt") != MatchType.GLOBAL:
+        return None
+    anim = r.get("animation") or config.get("animation") or {}
+    if (anim.get("type") or "none").lower() != "none":
+        return None
+    active = hex_to_colorref(r.get("active_border_color") or "default")
+    inactive = hex_to_colorref(r.get("inactive_border_color") or "default")
+    if active == COLOR_INVALID:
+        active = DWMWA_COLOR_DEFAULT
+    if inactive == COLOR_INVALID:
+        inactive = DWMWA_COLOR_DEFAULT
+    return (active, inactive)
+
+def invalidate_rule_cache():
+    """I drop memoized per-process rule resolutions after any config change."""
+    _rule_cache.clear()
+    # Força repintura: o atalho do caminho estático confia em _last_colors
+    _last_colors.clear()
+    _fast_static_state[0] = False
+    _fast_static_state[1] = None
+    _rule_split_state[0] = False
+    _rule_split_state[1] = ()
+    _rule_split_state[2] = None
+
+def _hex_to_rgb_int(s: Optional[str]) -> Optional[int]:
+    """I convert "#RRGGBB" from a rule into an RGB int 0xRRGGBB (or None)."""
+    if not isinstance(s, str):
+        return None
+    v = s.strip().lower()
+    if v in ("", "default", "none"):
+        return None
+    if v.startswith("#"):
+        v = v[1:]
+    if len(v) != 6:
+        return None
+    # Mesma guarda de hex_to_colorref: sem ela, "-12abc" viraria RGB negativo
+    if v.strip("0123456789abcdef"):
+        return None
+    return int(v, 16)
+
 # ---------- DWM application with differential updates ----------
 def set_dwm_border_color(hwnd: int, color: int):
     """I set the window border color via DWM, avoiding redundant syscalls."""
@@ -456,83 +703,129 @@ def set_dwm_border_color(hwnd: int, color: int):
     if prev == color:
         return
     try:
-        val = wt.DWORD(color & 0xFFFFFFFF)
-        _DwmSetWindowAttribute(
-            wt.HWND(hwnd), DWMWA_BORDER_COLOR,
-            ctypes.byref(val), ctypes.sizeof(val)
-        )
+        _color_buf.value = color & 0xFFFFFFFF
+        _DwmSetWindowAttribute(hwnd, DWMWA_BORDER_COLOR, ctypes.byref(_color_buf), 4)
         _last_colors[hwnd] = color
     except Exception:
         pass
 
-def apply_colors_once(config: dict, animated_only: bool = False):
+def apply_colors_once(config: dict, animated_only: bool = False) -> int:
     """
     I enumerate visible windows and apply either animation frames or static colors.
     When animated_only is True, I only touch windows that use animations.
+    I return how many windows matched an animated rule in this pass.
     """
     # Passo global: incrementa 1x por chamada desta função.
-    if not hasattr(apply_colors_once, "_pass_id"):
-        apply_colors_once._pass_id = 0  # type: ignore[attr-defined]
-    apply_colors_once._pass_id += 1     # type: ignore[attr-defined]
-    pass_id = apply_colors_once._pass_id  # type: ignore[attr-defined]
+    global _last_fg
+    pass_id = next(_pass_counter)
 
     global_anim_defaults = config.get("animation") or {"type": "none", "speed": 1.0}
 
-    def cb(hwnd, _):
-        if not u32.IsWindowVisible(wt.HWND(hwnd)):
+    if not _fast_static_state[0]:
+        _fast_static_state[1] = _compute_fast_static(config)
+        _fast_static_state[0] = True
+    fast = _fast_static_state[1]
+    if fast is not None:
+        # Só a regra Global, estática: sem matching, sem título/classe,
+        # sem resolução de processo — visibilidade, filtro e pintura.
+        if animated_only:
+            return 0
+        active, inactive = fast
+        fg = u32.GetForegroundWindow()
+        n = _snapshot_hwnds()
+        for i in range(n):
+            hwnd = _hwnd_arr[i]
+            if not u32.IsWindowVisible(hwnd):
+                continue
+            if u32.GetWindowLongW(hwnd, win32con.GWL_EXSTYLE) & win32con.WS_EX_TOOLWINDOW:
+                continue
+            if hwnd != fg and hwnd != _last_fg and hwnd in _last_colors:
+                continue
+            if u32.GetWindowTextLengthW(hwnd) <= 0:
+                continue
+            set_dwm_border_color(hwnd, active if hwnd == fg else inactive)
+        _last_fg = fg
+        return 0
+
+    if animated_only:
+        # Nada animado em lugar nenhum? Nem enumera.
+        if (global_anim_defaults.get("type") or "none").lower() == "none" and not any(
+            ((r.get("animation") or {}).get("type") or "none").lower() != "none"
+            for r in (config.get("window_rules") or [])
+        ):
+            return 0
+
+    anim_hits = [0]  # janelas que caíram em regra animada neste passo
+    # Um único syscall por passo: o foreground não muda no meio da enumeração
+    fg = u32.GetForegroundWindow()
+    # Cor do frame por chave de animação: N janelas com a mesma regra
+    # compartilham uma única interpolação (e um único swap BGR) por passo
+    frame_cache: Dict[str, Optional[int]] = {}
+
+    def cb(hwnd):
+        if not u32.IsWindowVisible(hwnd):
             return True
-        exstyle = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+        exstyle = u32.GetWindowLongW(hwnd, win32con.GWL_EXSTYLE)
         if exstyle & win32con.WS_EX_TOOLWINDOW:
             return True
-        title = win32gui.GetWindowText(hwnd) or ""
-        if not title.strip():
-            return True
-        class_name = win32gui.GetClassName(hwnd) or ""
         process_name = get_process_name(hwnd) or ""
 
-        # Regra preferencial; fallback no Global
-        rule = pick_rule(config, title, class_name, process_name)
-        if not rule:
-            rule = next(
-                (r for r in config.get("window_rules", [])
-                 if (r.get("match") or "").lower() == "global"),
-                None
-            )
+        ent = _rule_cache.get(process_name)
+        if ent is None:
+            title = _title_buf.value if u32.GetWindowTextW(hwnd, _title_buf, 512) else ""
+            if not title.strip():
+                return True
+            class_name = _class_buf.value if u32.GetClassNameW(hwnd, _class_buf, 256) else ""
+
+            # Regra preferencial; fallback no Global
+            rule = pick_rule(config, title, class_name, process_name)
+            if not rule:
+                rule = next(
+                    (r for r in config.get("window_rules", [])
+                     if r.get("_mt") == MatchType.GLOBAL),
+                    None
+                )
+
+            active, inactive, anim = resolve_colors(rule, {"animation": global_anim_defaults})
+
+            if anim["type"] != "none":
+                # CHAVE COMPARTILHADA para Global; por processo para Process
+                is_global_rule = (rule or {}).get("_mt") == MatchType.GLOBAL
+                key = f'GLOBAL|{anim["type"]}' if is_global_rule else f'{process_name}|{anim["type"]}'
+                # RGB já pré-computado no prime_rule; nada de parse por janela
+                a_rgb = (rule or {}).get("_a_rgb")
+                i_rgb = (rule or {}).get("_i_rgb")
+            else:
+                key = a_rgb = i_rgb = None
+
+            ent = (rule, active, inactive, anim, key, a_rgb, i_rgb)
+            _rule_cache[process_name] = ent
+        else:
+            # Cache hit: mantém o filtro de janela sem título, mas sem alocar
+            # a string (só o comprimento) e sem buscar a classe.
+            if u32.GetWindowTextLengthW(hwnd) <= 0:
+                return True
 
-        active, inactive, anim = resolve_colors(rule, {"animation": global_anim_defaults})
+        rule, active, inactive, anim, key, a_rgb, i_rgb = ent
 
         if animated_only and anim["type"] == "none":
             return True
 
         if anim["type"] != "none":
-            # CHAVE COMPARTILHADA para Global; por processo para Process
-            is_global_rule = (rule or {}).get("match", "").lower() == "global"
-            key = f'GLOBAL|{anim["type"]}' if is_global_rule else f'{process_name}|{anim["type"]}'
-
-            # Converte "#RRGGBB" do rule para inteiro RGB 0xRRGGBB
-            def _hex_to_rgb_int(s: Optional[str]) -> Optional[int]:
-                s = normalize_hex(s or "")
-                if s in ("default", "none"):
-                    return None
-                if not s or not s.startswith("#") or len(s) != 7:
-                    return None
-                try:
-                    r = int(s[1:3], 16)
-                    g = int(s[3:5], 16)
-                    b = int(s[5:7], 16)
-                    return (r << 16) | (g << 8) | b
-                except Exception:
-                    return None
-
-            a_rgb = _hex_to_rgb_int((rule or {}).get("active_border_color"))
-            i_rgb = _hex_to_rgb_int((rule or {}).get("inactive_border_color"))
-
-            c = Animation.color_for(key, anim["type"], anim["speed"], a_rgb, i_rgb, pass_id=pass_id)
-            if c is not None:
-                r = (c >> 16) & 0xFF
-                g = (c >> 8) & 0xFF
-                b = c & 0xFF
-                colorref = (b << 16) | (g << 8) | r  # RGB -> COLORREF (BGR)
+            anim_hits[0] += 1
+            if key in frame_cache:
+                colorref = frame_cache[key]
+            else:
+                c = Animation.color_for(key, anim["type"], anim["speed"], a_rgb, i_rgb, pass_id=pass_id)
+                if c is not None:
+                    r = (c >> 16) & 0xFF
+                    g = (c >> 8) & 0xFF
+                    b = c & 0xFF
+                    colorref = (b << 16) | (g << 8) | r  # RGB -> COLORREF (BGR)
+                else:
+                    colorref = None
+                frame_cache[key] = colorref
+            if colorref is not None:
                 set_dwm_border_color(hwnd, colorref)
             return True
 
@@ -540,42 +833,92 @@ def apply_colors_once(config: dict, animated_only: bool = False):
         if active == COLOR_INVALID or inactive == COLOR_INVALID:
             return True
 
-        fg = u32.GetForegroundWindow()
+        # O(ΔFG): janela já pintada só muda de cor quando entra/sai do
+        # foreground; janelas novas (sem entrada em _last_colors) pintam.
+        if hwnd != fg and hwnd != _last_fg and hwnd in _last_colors:
+            return True
+
         set_dwm_border_color(hwnd, active if hwnd == fg else inactive)
         return True
 
-    win32gui.EnumWindows(cb, None)
+    n = _snapshot_hwnds()
+    for i in range(n):
+        cb(_hwnd_arr[i])
+    if not animated_only:
+        # Passes animated_only não repintam janelas estáticas; avançar o
+        # registro aqui deixaria o foreground anterior preso na cor ativa.
+        _last_fg = fg
+    return anim_hits[0]
 
 
 # ---------- Windows utilities (lists) ----------
 def list_visible_windows() -> List[tuple]:
     """I return a list of (hwnd, title, class_name, process_name) for visible, non-tool windows."""
+    # Buffers e array locais: esta função roda em worker thread (refresh da
+    # UI), então não pode compartilhar os buffers do caminho quente da GUI.
     items = []
-    def cb(hwnd, _):
-        if not u32.IsWindowVisible(wt.HWND(hwnd)):
-            return True
-        ex = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+    hwnds: List[int] = []
+    cb = _WNDENUMPROC(lambda h, _l: (hwnds.append(h), True)[1])
+    u32.EnumWindows(cb, 0)
+    title_buf = ctypes.create_unicode_buffer(512)
+    class_buf = ctypes.create_unicode_buffer(256)
+    for hwnd in hwnds:
+        if not u32.IsWindowVisible(hwnd):
+            continue
+        ex = u32.GetWindowLongW(hwnd, win32con.GWL_EXSTYLE)
         if ex & win32con.WS_EX_TOOLWINDOW:
-            return True
-        title = win32gui.GetWindowText(hwnd) or ""
+            continue
+        title = title_buf.value if u32.GetWindowTextW(hwnd, title_buf, 512) else ""
         if not title.strip():
-            return True
-        cls = win32gui.GetClassName(hwnd) or ""
+            continue
+        cls = class_buf.value if u32.GetClassNameW(hwnd, class_buf, 256) else ""
         proc = get_process_name(hwnd) or ""
         items.append((hwnd, title, cls, proc))
-        return True
-    win32gui.EnumWindows(cb, None)
     return items
 
+def _enum_process_names(limit: int = 500) -> List[str]:
+    """I enumerate process names via psapi.EnumProcesses (no wrapper objects)."""
+    if psapi is None:
+        return []
+    pids = (wt.DWORD * 4096)()
+    needed = wt.DWORD(0)
+    if not psapi.EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(needed)):
+        return []
+    n = needed.value // ctypes.sizeof(wt.DWORD)
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    buf = ctypes.create_unicode_buffer(260)
+    names = set()
+    for i in range(n):
+        pid = pids[i]
+        if not pid:
+            continue
+        h = k32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not h:
+            continue
+        try:
+            size = wt.DWORD(len(buf))
+            if k32.QueryFullProcessImageNameW(h, 0, buf, ctypes.byref(size)):
+                name = buf.value.rpartition("\\")[2]
+                if name:
+                    names.add(name)
+                    if len(names) >= limit:
+                        break
+        finally:
+            k32.CloseHandle(h)
+    return sorted(names)
+
 def list_process_names(limit: int = 500) -> List[str]:
     """I return a sorted list of unique process executable names, capped by 'limit'."""
+    snap = _snapshot_pid_names()
+    if not snap:
+        # Snapshot indisponível (raro): EnumProcesses + nome por PID
+        return _enum_process_names(limit)
     names = set()
-    for p in psutil.process_iter(attrs=["name", "pid"]):
-        n = p.info.get("name") or ""
+    for n in snap.values():
         if n:
             names.add(n)
-        if len(names) >= limit:
-            break
+            if len(names) >= limit:
+                break
     return sorted(names)
 
 # ---------- Helpers for Process rules ----------
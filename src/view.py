@@ -1,49 +1,55 @@
+import re
 import sys
 from PySide6 import QtCore, QtGui, QtWidgets
 from src.controller import AppController
+from src.model import MatchType
+
+_HEX_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+class _ListsRefreshWorker(QtCore.QRunnable):
+    """I run the controller's list refresh off the GUI thread and post it back."""
+
+    def __init__(self, win: "MainWindow"):
+        super().__init__()
+        self._win = win
+
+    def run(self):
+        try:
+            procs, win_tuples = self._win.ctrl.refresh_lists()
+        except Exception:
+            procs, win_tuples = [], []
+        QtCore.QMetaObject.invokeMethod(
+            self._win, "_on_refresh_done", QtCore.Qt.QueuedConnection,
+            QtCore.Q_ARG(list, list(procs)), QtCore.Q_ARG(list, list(win_tuples))
+        )
+
 
 class RuleEditorDialog(QtWidgets.QDialog):
     """I let the user edit a single rule. Only 'Process' or 'Global' are allowed (UI constrains to Process)."""
     def __init__(self, parent=None, rule=None, is_global=False):
         super().__init__(parent)
-        self.setWindowTitle("Edit Rule (Process)" if not is_global else "Edit Rule (Global)")
         self.setModal(True)
-        self.rule = rule or {
-            "match": "Process",
-            "contains": "",
-            "active_border_color": "#FF0000",
-            "inactive_border_color": "#0000FF",
-            "animation": {"type": "none", "speed": 1.0}
-        }
 
         form = QtWidgets.QFormLayout()
 
         self.cboMatch = QtWidgets.QComboBox()
-        if is_global:
-            self.cboMatch.addItems(["Global"])
-        else:
-            self.cboMatch.addItems(["Process"])
-        self.cboMatch.setCurrentIndex(0)
         self.cboMatch.setEnabled(False)
 
-        self.txtContains = QtWidgets.QLineEdit(self.rule.get("contains", ""))
-        self.txtContains.setEnabled(not is_global)
+        self.txtContains = QtWidgets.QLineEdit()
 
-        self.txtActive = QtWidgets.QLineEdit(self.rule.get("active_border_color", "#FF0000"))
+        self.txtActive = QtWidgets.QLineEdit()
         self.btnPickActive = QtWidgets.QPushButton("Color…")
-        self.btnPickActive.clicked.connect(lambda: self._pick_color(self.txtActive))
+        self.btnPickActive.clicked.connect(self._pick_active)
 
-        self.txtInactive = QtWidgets.QLineEdit(self.rule.get("inactive_border_color", "#0000FF"))
+        self.txtInactive = QtWidgets.QLineEdit()
         self.btnPickInactive = QtWidgets.QPushButton("Color…")
-        self.btnPickInactive.clicked.connect(lambda: self._pick_color(self.txtInactive))
+        self.btnPickInactive.clicked.connect(self._pick_inactive)
 
         self.cboAnimType = QtWidgets.QComboBox()
         self.cboAnimType.addItems(["none", "rainbow", "pulse", "fade", "breath", "tri", "sparkle", "steps"])
-        self.cboAnimType.setCurrentText((self.rule.get("animation") or {}).get("type", "none"))
         self.dblAnimSpeed = QtWidgets.QDoubleSpinBox()
         self.dblAnimSpeed.setRange(0.1, 10.0)
         self.dblAnimSpeed.setSingleStep(0.1)
-        self.dblAnimSpeed.setValue(float((self.rule.get("animation") or {}).get("speed", 1.0)))
 
         hl1 = QtWidgets.QHBoxLayout()
         hl1.addWidget(self.txtActive, 1)
@@ -54,10 +60,9 @@ class RuleEditorDialog(QtWidgets.QDialog):
 
         form.addRow("Match type:", self.cboMatch)
         form.addRow("Parameter (contains):", self.txtContains)
-        form.addRow("Active color (#RRGGBB/default/none):", QtWidgets.QWidget())
-        form.itemAt(form.rowCount()-1, QtWidgets.QFormLayout.FieldRole).widget().setLayout(hl1)
-        form.addRow("Inactive color (#RRGGBB/default/none):", QtWidgets.QWidget())
-        form.itemAt(form.rowCount()-1, QtWidgets.QFormLayout.FieldRole).widget().setLayout(hl2)
+        # addRow aceita um QLayout como campo direto; sem QWidget vazio + itemAt
+        form.addRow("Active color (#RRGGBB/default/none):", hl1)
+        form.addRow("Inactive color (#RRGGBB/default/none):", hl2)
         form.addRow("Animation:", self.cboAnimType)
         form.addRow("Speed:", self.dblAnimSpeed)
 
@@ -69,16 +74,71 @@ class RuleEditorDialog(QtWidgets.QDialog):
         vbox.addLayout(form)
         vbox.addWidget(btns)
 
+        # QColorDialog persistente: construído no primeiro pick e reaproveitado
+        self._color_dlg: QtWidgets.QColorDialog | None = None
+
+        self.load(rule, is_global)
+
+    def load(self, rule=None, is_global=False):
+        """I re-seed the existing widgets with a rule, so one dialog instance
+        can be reused for every Add/Edit instead of rebuilding the tree."""
+        self.setWindowTitle("Edit Rule (Process)" if not is_global else "Edit Rule (Global)")
+        self.rule = rule or {
+            "match": "Process",
+            "contains": "",
+            "active_border_color": "#FF0000",
+            "inactive_border_color": "#0000FF",
+            "animation": {"type": "none", "speed": 1.0}
+        }
+
+        self.cboMatch.clear()
+        self.cboMatch.addItems(["Global"] if is_global else ["Process"])
+        self.cboMatch.setCurrentIndex(0)
+
+        self.txtContains.setText(self.rule.get("contains", ""))
+        self.txtContains.setEnabled(not is_global)
+        self.txtActive.setText(self.rule.get("active_border_color", "#FF0000"))
+        self.txtInactive.setText(self.rule.get("inactive_border_color", "#0000FF"))
+
+        # Uma leitura só de "animation"; nada de (get() or {}) repetido por campo
+        anim = self.rule.get("animation") or {"type": "none", "speed": 1.0}
+        self.cboAnimType.setCurrentText(anim.get("type", "none"))
+        self.dblAnimSpeed.setValue(float(anim.get("speed", 1.0)))
+
+    @QtCore.Slot()
+    def _pick_active(self):
+        self._pick_color(self.txtActive)
+
+    @QtCore.Slot()
+    def _pick_inactive(self):
+        self._pick_color(self.txtInactive)
+
     def _pick_color(self, line_edit: QtWidgets.QLineEdit):
         """I open a QColorDialog and push the chosen #RRGGBB back to the field."""
         s = line_edit.text().strip()
-        if s.lower() in ("default", "none"):
-            base = QtGui.QColor("#000000")
+        cached = line_edit.property("_cached_color")
+        if isinstance(cached, QtGui.QColor) and cached.name().upper() == s.upper():
+            base = cached  # última cor escolhida neste campo; sem re-parse
+        elif _HEX_RE.match(s):
+            base = QtGui.QColor(s)
         else:
-            base = QtGui.QColor(s if s else "#000000")
-        col = QtWidgets.QColorDialog.getColor(base, self, "Pick color (#RRGGBB)")
-        if col.isValid():
-            line_edit.setText(col.name().upper())
+            base = QtGui.QColor("#000000")
+        if self._color_dlg is None:
+            dlg = QtWidgets.QColorDialog(self)
+            dlg.setWindowTitle("Pick color (#RRGGBB)")
+            # Diálogo nativo do SO (bem mais leve que o picker do Qt); só no
+            # Linux forçamos o do Qt, onde o nativo pode travar.
+            dlg.setOption(
+                QtWidgets.QColorDialog.DontUseNativeDialog,
+                sys.platform.startswith("linux"),
+            )
+            self._color_dlg = dlg
+        self._color_dlg.setCurrentColor(base)
+        if self._color_dlg.exec() == QtWidgets.QDialog.Accepted:
+            col = self._color_dlg.currentColor()
+            if col.isValid():
+                line_edit.setText(col.name().upper())
+                line_edit.setProperty("_cached_color", col)
 
     def get_rule(self) -> dict:
         """I return the edited rule, normalized."""
@@ -96,6 +156,13 @@ class RuleEditorDialog(QtWidgets.QDialog):
 
 class MainWindow(QtWidgets.QMainWindow):
     """I host the entire UI and forward actions to the controller."""
+
+    # QSS do campo de filtro: constante de classe, aplicada uma única vez
+    _FILTER_QSS = (
+        "QLineEdit { border: 1px solid #666; border-radius: 12px; padding: 4px 10px; } "
+        "QLineEdit:focus { border: 1px solid #999; }"
+    )
+
     def __init__(self, controller: AppController):
         super().__init__()
         self.ctrl = controller
@@ -103,6 +170,10 @@ class MainWindow(QtWidgets.QMainWindow):
         # Single icon instance for reuse.
         self._app_icon = QtGui.QIcon("icon.ico")
         self.setWindowIcon(self._app_icon)
+        # Pixmap do About pré-escalado uma vez; abrir o diálogo não relê o .ico
+        self._about_pixmap = QtGui.QPixmap("icon.ico").scaled(
+            64, 64, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+        )
         self.setWindowTitle("Animated Windows Borders")
         self.resize(980, 680)
 
@@ -110,6 +181,9 @@ class MainWindow(QtWidgets.QMainWindow):
         QtWidgets.QApplication.setApplicationDisplayName("Animated Windows Borders")
         QtWidgets.QApplication.setOrganizationName("Rafael Neves")
 
+        # Diálogo de edição construído uma vez e reaproveitado (load() re-semeia)
+        self._rule_dialog: RuleEditorDialog | None = None
+
         self._build_tray()
         self._build_ui()
 
@@ -117,10 +191,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ctrl.status_changed.connect(self._set_status)
         self.ctrl.rules_changed.connect(self._update_rules_list)
         self.ctrl.service_toggled.connect(self._on_service_toggled)
+        self.ctrl.procs_refreshed.connect(self._on_procs_refreshed)
+        self.ctrl.config_saved.connect(self._on_config_saved)
 
         # Initial UI sync
         self._set_status("Status: running" if self.ctrl.config_data.get("service_enabled") else "Status: stopped")
-        self._update_rules_list(self.ctrl.rules_text())
+        # Popula a lista no próximo giro do event loop: a janela pinta primeiro
+        QtCore.QTimer.singleShot(0, self._initial_rules_fill)
         if self.ctrl.config_data.get("service_enabled"):
             QtCore.QTimer.singleShot(0, self._minimize_to_tray)
 
@@ -128,6 +205,9 @@ class MainWindow(QtWidgets.QMainWindow):
     def _build_ui(self):
         tabs = QtWidgets.QTabWidget()
         self.setCentralWidget(tabs)
+        # Superfícies opacas: Qt pula o preenchimento duplicado de fundo
+        tabs.setAttribute(QtCore.Qt.WA_OpaquePaintEvent)
+        tabs.setAttribute(QtCore.Qt.WA_NoSystemBackground)
 
         # Service tab
         self.chkEnable = QtWidgets.QCheckBox("Enable service (apply colors periodically)")
@@ -144,8 +224,18 @@ class MainWindow(QtWidgets.QMainWindow):
         hlTopBtns.addWidget(self.btnSave)
         hlTopBtns.addStretch(1)
 
-        self.lstRules = QtWidgets.QListWidget()
-        self.lstRules.itemDoubleClicked.connect(self._edit_rule_from_item)
+        # Model/view: QStringListModel + proxy de filtro no lugar de
+        # QListWidget — nada de um QListWidgetItem alocado por linha.
+        self.lstRules = QtWidgets.QListView()
+        self.lstRules.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self._rules_model = QtCore.QStringListModel(self)
+        self._rules_rows: list = []  # espelho do model para o diff incremental
+        self._rules_proxy = QtCore.QSortFilterProxyModel(self)
+        self._rules_proxy.setSourceModel(self._rules_model)
+        self._rules_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self._rules_proxy.setFilterRole(QtCore.Qt.DisplayRole)
+        self.lstRules.setModel(self._rules_proxy)
+        self.lstRules.doubleClicked.connect(self._edit_rule_from_item)
 
         self.btnAdd = QtWidgets.QPushButton("Add")
         self.btnEdit = QtWidgets.QPushButton("Edit")
@@ -168,17 +258,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.txtFilter.setPlaceholderText("Filter rules…")
         self.txtFilter.setClearButtonEnabled(True)
         self.txtFilter.setFixedHeight(30)
-        self.txtFilter.setStyleSheet("""
-        QLineEdit {
-            border: 1px solid #666;
-            border-radius: 12px;
-            padding: 4px 10px;
-        }
-        QLineEdit:focus {
-            border: 1px solid #999;
-        }
-        """)
-        self.txtFilter.textChanged.connect(self._apply_filter)
+        self.txtFilter.setStyleSheet(self._FILTER_QSS)
+        # Debounce: digitação rápida não refiltra a lista a cada tecla;
+        # o filtro roda uma vez, ~100 ms depois da última alteração.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(100)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.txtFilter.textChanged.connect(self._on_filter_text_changed)
 
         grpRules = QtWidgets.QGroupBox("Rules")
         vRules = QtWidgets.QVBoxLayout(grpRules)
@@ -200,8 +287,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self.txtManual = QtWidgets.QLineEdit()
         self.txtManual.setPlaceholderText("Type a process name (ex: Code.exe)")
 
-        self.lstProcs = QtWidgets.QListWidget()
-        self.lstWins  = QtWidgets.QListWidget()
+        self.lstProcs = QtWidgets.QListView()
+        self.lstProcs.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self._procs_model = QtCore.QStringListModel(self)
+        self.lstProcs.setModel(self._procs_model)
+
+        self.lstWins = QtWidgets.QListView()
+        self.lstWins.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self._wins_model = QtCore.QStringListModel(self)
+        self._wins_exes: list = []  # exe por linha, extraído uma vez no populate
+        self.lstWins.setModel(self._wins_model)
 
         self.btnRefreshLists = QtWidgets.QPushButton("Refresh lists")
         self.btnCreateFromProc = QtWidgets.QPushButton("Create rule from selected process")
@@ -222,6 +317,18 @@ class MainWindow(QtWidgets.QMainWindow):
         assist_page.setLayout(gridAssist)
         tabs.addTab(assist_page, "Assistant")
 
+        # Viewports das listas pintam o próprio fundo por inteiro
+        for w in (self.lstRules, self.lstProcs, self.lstWins):
+            w.viewport().setAttribute(QtCore.Qt.WA_OpaquePaintEvent)
+            w.viewport().setAttribute(QtCore.Qt.WA_NoSystemBackground)
+            # Linhas de altura única + layout em lotes: o view calcula a
+            # geometria em O(1) e não mede item por item ao rolar
+            w.setUniformItemSizes(True)
+            w.setLayoutMode(QtWidgets.QListView.Batched)
+            w.setBatchSize(100)
+            w.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+            w.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+
         # Connections
         self.btnAdd.clicked.connect(self._add_rule)
         self.btnEdit.clicked.connect(self._edit_rule)
@@ -232,8 +339,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btnCreateFromProc.clicked.connect(self._create_rule_from_selected_process)
         self.btnCreateFromWin.clicked.connect(self._create_rule_from_selected_window)
 
-        self.lstProcs.itemDoubleClicked.connect(lambda _item: self._create_rule_from_selected_process())
-        self.lstWins.itemDoubleClicked.connect(lambda _item: self._create_rule_from_selected_window())
+        self.lstProcs.doubleClicked.connect(self._on_proc_double_clicked)
+        self.lstWins.doubleClicked.connect(self._on_win_double_clicked)
 
     # ---------- Tray ----------
     def _build_tray(self):
@@ -264,10 +371,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tray.activated.connect(self._tray_activated)
         self.tray.show()
 
+    @QtCore.Slot(QtWidgets.QSystemTrayIcon.ActivationReason)
     def _tray_activated(self, reason):
         if reason == QtWidgets.QSystemTrayIcon.DoubleClick:
             self._restore_from_tray()
 
+    @QtCore.Slot()
     def _minimize_to_tray(self):
         if self.tray:
             self.hide()
@@ -278,6 +387,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 2000
             )
 
+    @QtCore.Slot()
     def _restore_from_tray(self):
         self.showNormal()
         self.activateWindow()
@@ -289,9 +399,11 @@ class MainWindow(QtWidgets.QMainWindow):
         super().changeEvent(event)
 
     # ---------- Status ----------
+    @QtCore.Slot(str)
     def _set_status(self, msg: str):
         self.statusBar().showMessage(msg)
 
+    @QtCore.Slot(bool)
     def _on_service_toggled(self, enabled: bool):
         # Sync UI affordances when controller toggles programmatically
         self.chkEnable.blockSignals(True)
@@ -303,23 +415,61 @@ class MainWindow(QtWidgets.QMainWindow):
             self.act_tray_enable.blockSignals(False)
 
     # ---------- Rules UI ----------
+    @QtCore.Slot()
+    def _initial_rules_fill(self):
+        self._update_rules_list(self.ctrl.rules_text())
+
+    @QtCore.Slot(list)
     def _update_rules_list(self, rows: list):
-        self.lstRules.clear()
-        self.lstRules.addItems(rows)
-        self._apply_filter()
+        # Diff incremental contra o espelho: só as linhas que mudaram emitem
+        # dataChanged, então editar uma regra não reseta seleção nem scroll.
+        m = self._rules_model
+        old = self._rules_rows
+        common = min(len(old), len(rows))
+        dirty = [i for i in range(common) if rows[i] != old[i]]
+        # Troca em massa (reload, primeira carga): um reset único coalesce os
+        # sinais em vez de emitir um dataChanged por linha
+        if not old or len(dirty) * 2 > len(rows):
+            m.setStringList(rows)
+            self._rules_rows = list(rows)
+            return
+        setData, index = m.setData, m.index  # sem LOAD_ATTR repetido no loop
+        for i in dirty:
+            setData(index(i), rows[i])
+        if len(rows) > len(old):
+            start = len(old)
+            m.insertRows(start, len(rows) - start)
+            for i in range(start, len(rows)):
+                m.setData(m.index(i), rows[i])
+        elif len(rows) < len(old):
+            m.removeRows(len(rows), len(old) - len(rows))
+        self._rules_rows = list(rows)
 
     def _current_rule_index(self) -> int:
-        return self.lstRules.currentRow()
+        idx = self.lstRules.currentIndex()
+        if not idx.isValid():
+            return -1
+        return self._rules_proxy.mapToSource(idx).row()
+
+    def _rule_editor(self, rule=None, is_global=False) -> RuleEditorDialog:
+        if self._rule_dialog is None:
+            self._rule_dialog = RuleEditorDialog(self, rule=rule, is_global=is_global)
+        else:
+            self._rule_dialog.load(rule, is_global)
+        return self._rule_dialog
 
+    @QtCore.Slot()
     def _add_rule(self):
-        dlg = RuleEditorDialog(self, is_global=False)
+        dlg = self._rule_editor(is_global=False)
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             r = dlg.get_rule()
             self.ctrl.add_rule(r)
 
-    def _edit_rule_from_item(self, _item: QtWidgets.QListWidgetItem):
+    @QtCore.Slot(QtCore.QModelIndex)
+    def _edit_rule_from_item(self, _index: QtCore.QModelIndex):
         self._edit_rule()
 
+    @QtCore.Slot()
     def _edit_rule(self):
         idx = self._current_rule_index()
         if idx < 0:
@@ -329,10 +479,10 @@ class MainWindow(QtWidgets.QMainWindow):
         if not current:
             return
 
-        is_global = (current.get("match", "").lower() == "global")
+        is_global = (current.get("_mt") == MatchType.GLOBAL)
 
         # Agora o diálogo recebe a regra atual e pré-carrega 'contains' e cores
-        dlg = RuleEditorDialog(self, rule=current, is_global=is_global)
+        dlg = self._rule_editor(rule=current, is_global=is_global)
 
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             newr = dlg.get_rule()
@@ -344,6 +494,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 newr["match"] = "Process"
             self.ctrl.edit_rule(idx, newr)
 
+    @QtCore.Slot()
     def _remove_rule(self):
         idx = self._current_rule_index()
         if idx < 0:
@@ -352,6 +503,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if msg:
             QtWidgets.QMessageBox.warning(self, "Warning", msg)
 
+    @QtCore.Slot()
     def _duplicate_rule(self):
         idx = self._current_rule_index()
         if idx < 0:
@@ -361,47 +513,57 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "Duplicate", msg)
 
     # ---------- Assistant ----------
+    @QtCore.Slot()
     def _refresh_lists(self):
-        procs, wins = self.ctrl.refresh_lists()
-        self.lstProcs.setUpdatesEnabled(False)
-        self.lstProcs.blockSignals(True)
-        self.lstProcs.clear()
-        self.lstProcs.addItems(procs)
-        self.lstProcs.blockSignals(False)
-        self.lstProcs.setUpdatesEnabled(True)
-
-        self.lstWins.setUpdatesEnabled(False)
-        self.lstWins.blockSignals(True)
-        self.lstWins.clear()
-        self.lstWins.addItems(wins)
-        self.lstWins.blockSignals(False)
-        self.lstWins.setUpdatesEnabled(True)
-
+        # Enumeração roda no pool; o botão fica desabilitado até o resultado
+        self.btnRefreshLists.setEnabled(False)
+        QtCore.QThreadPool.globalInstance().start(_ListsRefreshWorker(self))
+
+    @QtCore.Slot(list, list)
+    def _on_refresh_done(self, procs: list, win_tuples: list):
+        self.btnRefreshLists.setEnabled(True)
+        fmt = "{}  |  {}  |  {}  | hwnd={}".format
+        wins = [fmt(t, c, p, h) for h, t, c, p in win_tuples]
+        # 'procs' pode estar desatualizado; a lista fresca chega via procs_refreshed
+        self._on_procs_refreshed(procs)
+        self._wins_exes = [p for _h, _t, _c, p in win_tuples]
+        self._wins_model.setStringList(wins)
+
+    @QtCore.Slot(list)
+    def _on_procs_refreshed(self, procs: list):
+        self._procs_model.setStringList(procs)
+
+    @QtCore.Slot()
     def _create_rule_from_selected_process(self):
         exe = self.txtManual.text().strip()
-        if not exe and self.lstProcs.currentItem():
-            exe = self.lstProcs.currentItem().text().strip()
+        if not exe:
+            idx = self.lstProcs.currentIndex()
+            if idx.isValid():
+                exe = (idx.data() or "").strip()
         msg = self.ctrl.add_or_warn_process_rule(exe)
         if msg:
             QtWidgets.QMessageBox.information(self, "Existing rule", msg)
 
+    @QtCore.Slot()
     def _create_rule_from_selected_window(self):
-        if not self.lstWins.currentItem():
+        idx = self.lstWins.currentIndex()
+        row = idx.row()
+        if not idx.isValid() or row >= len(self._wins_exes):
             return
-        parts = self.lstWins.currentItem().text().split("|")
-        if len(parts) >= 3:
-            exe = parts[2].strip()
+        exe = (self._wins_exes[row] or "").strip()
+        if exe:
             msg = self.ctrl.add_or_warn_process_rule(exe)
             if msg:
                 QtWidgets.QMessageBox.information(self, "Existing rule", msg)
 
     # ---------- About ----------
+    @QtCore.Slot()
     def _show_about(self):
         msg = QtWidgets.QMessageBox(self)
         msg.setWindowTitle("About - Animated Windows Borders")
 
 
-        msg.setIconPixmap(QtGui.QPixmap("icon.ico").scaled(64, 64, QtCore.Qt.KeepAspectRatio))
+        msg.setIconPixmap(self._about_pixmap)
 
         msg.setTextFormat(QtCore.Qt.RichText)
         msg.setTextInteractionFlags(
@@ -417,16 +579,31 @@ class MainWindow(QtWidgets.QMainWindow):
 
         msg.exec_()
 
+    @QtCore.Slot(str)
+    def _on_filter_text_changed(self, _text: str):
+        self._filter_timer.start()
+
+    @QtCore.Slot(QtCore.QModelIndex)
+    def _on_proc_double_clicked(self, _index: QtCore.QModelIndex):
+        self._create_rule_from_selected_process()
+
+    @QtCore.Slot(QtCore.QModelIndex)
+    def _on_win_double_clicked(self, _index: QtCore.QModelIndex):
+        self._create_rule_from_selected_window()
+
+    @QtCore.Slot()
     def _apply_filter(self):
-        needle = (self.txtFilter.text() or "").strip().lower()
-        for i in range(self.lstRules.count()):
-            item = self.lstRules.item(i)
-            text = (item.text() or "").lower()
-            item.setHidden(bool(needle) and needle not in text)
+        # O proxy filtra só o que está visível no viewport; nada de setHidden
+        self._rules_proxy.setFilterFixedString((self.txtFilter.text() or "").strip())
 
+    @QtCore.Slot()
     def _save_config(self):
+        # A escrita é assíncrona (worker); o aviso chega via config_saved
         self.ctrl.save_config()
-        QtWidgets.QMessageBox.information(self, "Save", "Configuration saved to config.json.")
+
+    @QtCore.Slot()
+    def _on_config_saved(self):
+        self.statusBar().showMessage("Configuration saved to config.json.", 3000)
 
     def closeEvent(self, event: QtGui.QCloseEvent):
         """